@@ -72,6 +72,8 @@ class CycleManager(BaseObject):
             to_ += rest
 
         subject_ids_to_parse = subject_ids[from_:to_]
+        # Load all subjects shared data in one backend access
+        shared.prefetch(shared.get_self_keys(subject_ids_to_parse))
 
         # Build list of subjects for compute them
         subjects = []
@@ -149,7 +151,12 @@ class CycleManager(BaseObject):
         self.logger.info('Process cycle {}'.format(self.current_cycle))
 
         events = []
-        shared.commit()
+        commit_statistics = shared.commit()
+        self.logger.info('Shared data commit: {} keys, {} bytes in {}s'.format(
+            commit_statistics.keys_count,
+            commit_statistics.bytes_count,
+            commit_statistics.duration,
+        ))
 
         # TODO: gestion des behaviours non parallelisables
         # TODO: Proposer des ordres d'execution
@@ -1,12 +1,13 @@
 # coding: utf-8
 import pickle
+import time
 import typing
 
-import redis
-
 from synergine2.base import IdentifiedObject
 from synergine2.exceptions import SynergineException
 from synergine2.exceptions import UnknownSharedData
+from synergine2.share_backend import RedisSharedDataBackend
+from synergine2.share_backend import SharedDataBackend
 
 if typing.TYPE_CHECKING:
     from synergine2.simulation import Subject
@@ -61,8 +62,11 @@ class SharedData(object):
                 raise NotImplementedError()
 
     def get_final_key(self, instance: IdentifiedObject) -> str:
+        return self.get_final_key_from_id(instance.id)
+
+    def get_final_key_from_id(self, instance_id: int) -> str:
         if self.self_type:
-            return '{}_{}'.format(instance.id, self._key)
+            return '{}_{}'.format(instance_id, self._key)
         return self._key
 
     @property
@@ -117,27 +121,77 @@ class TrackedList(list):
     # TODO: Cover all methods
 
 
+class CommitStatistics(object):
+    def __init__(
+        self,
+        keys_count: int=0,
+        bytes_count: int=0,
+        serialization_time: float=0.0,
+        write_time: float=0.0,
+    ) -> None:
+        """
+        :param keys_count: number of written keys
+        :param bytes_count: number of written bytes
+        :param serialization_time: time spent to serialize values (seconds)
+        :param write_time: time spent to write into backend (seconds)
+        """
+        self.keys_count = keys_count
+        self.bytes_count = bytes_count
+        self.serialization_time = serialization_time
+        self.write_time = write_time
+
+    @property
+    def duration(self) -> float:
+        return self.serialization_time + self.write_time
+
+    def __repr__(self):
+        return 'CommitStatistics(keys={}, bytes={}, duration={:.6f}s)'.format(
+            self.keys_count,
+            self.bytes_count,
+            self.duration,
+        )
+
+
 class SharedDataManager(object):
     """
     This object is designed to own shared memory between processes. It must be feed (with set method) before
     start of processes. Processes will only be able to access shared memory filled here before start.
+    Data are stored in given backend (default is RedisSharedDataBackend).
     """
-    def __init__(self, clear: bool=True):
-        self._r = redis.StrictRedis(host='localhost', port=6379, db=0)  # TODO: configs
+    def __init__(self, clear: bool=True, backend: SharedDataBackend=None):
+        self._backend = backend or RedisSharedDataBackend()
 
         self._shared_data_list = []  # type: typing.List[SharedData]
 
         self._data = {}
+        self._missing_keys = set()  # type: typing.Set[str]
         self._modified_keys = set()
         self._default_values = {}
         self._special_types = {}  # type: typing.Dict[str, typing.Union[typing.Type[TrackedDict], typing.Type[TrackedList]]]  # nopep8
+        self.last_commit_statistics = CommitStatistics()
+
+        if clear:
+            self.clear()
+
+    @property
+    def backend(self) -> SharedDataBackend:
+        return self._backend
 
+    def set_backend(self, backend: SharedDataBackend, clear: bool=True) -> None:
+        """
+        Replace storage backend. Must be called before start of processes.
+        :param backend: new backend
+        :param clear: clear new backend content
+        """
+        self._backend = backend
+        self._data = {}
         if clear:
             self.clear()
 
     def clear(self) -> None:
-        self._r.flushdb()
+        self._backend.clear()
         self._data = {}
+        self._missing_keys = set()
         self._modified_keys = set()
 
     def reset(self) -> None:
@@ -148,17 +202,22 @@ class SharedDataManager(object):
 
     def purge_data(self):
         self._data = {}
+        self._missing_keys = set()
 
     def set(self, key: str, value: typing.Any) -> None:
         # FIXME: Called tout le temps !
         self._data[key] = value
+        self._missing_keys.discard(key)
         self._modified_keys.add(key)
 
     def get(self, key: str) -> typing.Any:
         try:
             return self._data[key]
         except KeyError:
-            database_value = self._r.get(key)
+            if key in self._missing_keys:
+                raise UnknownSharedData('No shared data for key "{}"'.format(key))
+
+            database_value = self._backend.get(key)
             if database_value is None:
                 # We not allow None value storage
                 raise UnknownSharedData('No shared data for key "{}"'.format(key))
@@ -167,15 +226,55 @@ class SharedDataManager(object):
 
         return self._data[key]
 
-    def commit(self) -> None:
+    def commit(self) -> CommitStatistics:
+        """
+        Write modified data into backend with one batched operation.
+        :return: statistics about this commit (also available in last_commit_statistics)
+        """
+        start_time = time.time()
+        values = {}
         for key in self._modified_keys:
-            value = self.get(key)
-            self._r.set(key, pickle.dumps(value))
+            values[key] = pickle.dumps(self.get(key))
+        serialization_end_time = time.time()
 
+        self._backend.set_many(values)
         self._modified_keys = set()
 
+        self.last_commit_statistics = CommitStatistics(
+            keys_count=len(values),
+            bytes_count=sum(len(v) for v in values.values()),
+            serialization_time=serialization_end_time - start_time,
+            write_time=time.time() - serialization_end_time,
+        )
+        return self.last_commit_statistics
+
     def refresh(self) -> None:
         self._data = {}
+        self._missing_keys = set()
+
+    def prefetch(self, keys: typing.Iterable[str]) -> None:
+        """
+        Load given keys from backend with one batched read. Following get of these
+        keys will not require backend access. Unknown keys are remembered as missing
+        until next refresh.
+        """
+        keys = [k for k in keys if k not in self._data and k not in self._missing_keys]
+        for key, database_value in zip(keys, self._backend.get_many(keys)):
+            if database_value is None:
+                self._missing_keys.add(key)
+            else:
+                self._data[key] = pickle.loads(database_value)
+
+    def get_self_keys(self, instance_ids: typing.Iterable[int]) -> typing.List[str]:
+        """
+        :return: final keys of all self shared data (see create_self) of given instance ids
+        """
+        self_shared_data_list = [sd for sd in self._shared_data_list if sd.self_type]
+        return [
+            shared_data.get_final_key_from_id(instance_id)
+            for instance_id in instance_ids
+            for shared_data in self_shared_data_list
+        ]
 
     def make_index(
         self,
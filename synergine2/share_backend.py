@@ -0,0 +1,260 @@
+# coding: utf-8
+import os
+import struct
+import typing
+
+import redis
+
+from synergine2.exceptions import SynergineException
+
+try:
+    from multiprocessing import shared_memory
+except ImportError:  # Python < 3.8
+    shared_memory = None
+
+
+class SharedDataBackendError(SynergineException):
+    pass
+
+
+class SharedDataBackend(object):
+    """
+    Storage used by SharedDataManager to make data available across processes.
+    Backend only manipulate bytes: serialization is made by SharedDataManager.
+    """
+    def get(self, key: str) -> typing.Optional[bytes]:
+        raise NotImplementedError()
+
+    def get_many(self, keys: typing.List[str]) -> typing.List[typing.Optional[bytes]]:
+        """
+        Read all given keys in one batched operation.
+        :return: values in same order than keys, None for unknown keys
+        """
+        return [self.get(key) for key in keys]
+
+    def set(self, key: str, value: bytes) -> None:
+        raise NotImplementedError()
+
+    def set_many(self, values: typing.Dict[str, bytes]) -> None:
+        """
+        Write all given values in one batched operation.
+        """
+        for key, value in values.items():
+            self.set(key, value)
+
+    def clear(self) -> None:
+        raise NotImplementedError()
+
+
+class RedisSharedDataBackend(SharedDataBackend):
+    def __init__(
+        self,
+        host: str='localhost',
+        port: int=6379,
+        db: int=0,
+    ) -> None:
+        self._r = redis.StrictRedis(host=host, port=port, db=db)
+
+    def get(self, key: str) -> typing.Optional[bytes]:
+        return self._r.get(key)
+
+    def get_many(self, keys: typing.List[str]) -> typing.List[typing.Optional[bytes]]:
+        if not keys:
+            return []
+        return self._r.mget(keys)
+
+    def set(self, key: str, value: bytes) -> None:
+        self._r.set(key, value)
+
+    def set_many(self, values: typing.Dict[str, bytes]) -> None:
+        if values:
+            self._r.mset(values)
+
+    def clear(self) -> None:
+        self._r.flushdb()
+
+
+class MemorySharedDataBackend(SharedDataBackend):
+    """
+    Keep data in current process memory: there is no round-trip at all. Data
+    written after processes fork are NOT visible by these processes, so use it
+    only when simulation is computed in one process.
+    """
+    def __init__(self) -> None:
+        self._data = {}  # type: typing.Dict[str, bytes]
+
+    def get(self, key: str) -> typing.Optional[bytes]:
+        return self._data.get(key)
+
+    def set(self, key: str, value: bytes) -> None:
+        self._data[key] = value
+
+    def set_many(self, values: typing.Dict[str, bytes]) -> None:
+        self._data.update(values)
+
+    def clear(self) -> None:
+        self._data = {}
+
+
+class SharedMemorySharedDataBackend(SharedDataBackend):
+    """
+    Store data in a shared memory block visible by forked processes.
+
+    Block is an append-only log of records. Header contains a generation
+    number and the end offset of the log. Readers replay records appended
+    since their last read to update their local index. When block is full,
+    writer compact it (only last values are kept) and increment generation:
+    readers then replay the entire log.
+
+    IMPORTANT: Only one process must write (the main process, with commit)
+    and it must not write while other processes read (which is the case with
+    CycleManager: commit is made before workers jobs).
+    """
+    _header = struct.Struct('<QQ')  # generation, log end offset
+    _record_header = struct.Struct('<IQ')  # key length, value length
+    _deleted = 0xFFFFFFFFFFFFFFFF
+
+    def __init__(self, size: int=64 * 1024 * 1024) -> None:
+        if shared_memory is None:
+            raise SharedDataBackendError(
+                'Shared memory backend require python 3.8 or higher',
+            )
+
+        self._memory = shared_memory.SharedMemory(create=True, size=size)
+        self._owner_pid = os.getpid()
+        self._size = self._memory.size
+        self._generation = 0
+        self._read_offset = self._header.size
+        self._index = {}  # type: typing.Dict[str, typing.Tuple[int, int]]
+        self._write_header(0, self._header.size)
+
+    def __del__(self):
+        if getattr(self, '_memory', None) is not None:
+            self.close()
+
+    def close(self) -> None:
+        """
+        Release shared memory block. Block is destroyed only if closed by the
+        process who created it.
+        """
+        if self._memory is None:
+            return
+
+        self._memory.close()
+        if os.getpid() == self._owner_pid:
+            self._memory.unlink()
+        self._memory = None
+
+    def _read_header(self) -> typing.Tuple[int, int]:
+        return self._header.unpack_from(self._memory.buf, 0)
+
+    def _write_header(self, generation: int, end_offset: int) -> None:
+        self._header.pack_into(self._memory.buf, 0, generation, end_offset)
+
+    def _update_index(self) -> None:
+        generation, end_offset = self._read_header()
+        if generation != self._generation:
+            self._generation = generation
+            self._read_offset = self._header.size
+            self._index = {}
+
+        buf = self._memory.buf
+        offset = self._read_offset
+        while offset < end_offset:
+            key_length, value_length = self._record_header.unpack_from(buf, offset)
+            offset += self._record_header.size
+            key = bytes(buf[offset:offset + key_length]).decode('utf-8')
+            offset += key_length
+
+            if value_length == self._deleted:
+                self._index.pop(key, None)
+            else:
+                self._index[key] = (offset, value_length)
+                offset += value_length
+
+        self._read_offset = offset
+
+    def _append(self, records: typing.List[typing.Tuple[str, typing.Optional[bytes]]]) -> None:
+        self._update_index()
+        encoded_records = [(k.encode('utf-8'), v) for k, v in records]
+        required_size = sum(
+            self._record_header.size + len(k) + (len(v) if v is not None else 0)
+            for k, v in encoded_records
+        )
+
+        if self._read_offset + required_size > self._size:
+            self._compact(required_size)
+
+        buf = self._memory.buf
+        offset = self._read_offset
+        for key, value in encoded_records:
+            value_length = len(value) if value is not None else self._deleted
+            self._record_header.pack_into(buf, offset, len(key), value_length)
+            offset += self._record_header.size
+            buf[offset:offset + len(key)] = key
+            offset += len(key)
+
+            if value is not None:
+                buf[offset:offset + len(value)] = value
+                offset += len(value)
+
+        self._write_header(self._generation, offset)
+        self._update_index()
+
+    def _compact(self, required_size: int) -> None:
+        buf = self._memory.buf
+        values = [
+            (key.encode('utf-8'), bytes(buf[offset:offset + length]))
+            for key, (offset, length) in self._index.items()
+        ]
+        values_size = sum(self._record_header.size + len(k) + len(v) for k, v in values)
+
+        if self._header.size + values_size + required_size > self._size:
+            raise SharedDataBackendError(
+                'Shared memory block is full ({} bytes), increase its size'.format(
+                    self._size,
+                ),
+            )
+
+        offset = self._header.size
+        for key, value in values:
+            self._record_header.pack_into(buf, offset, len(key), len(value))
+            offset += self._record_header.size
+            buf[offset:offset + len(key)] = key
+            offset += len(key)
+            buf[offset:offset + len(value)] = value
+            offset += len(value)
+
+        self._write_header(self._generation + 1, offset)
+        self._update_index()
+
+    def get(self, key: str) -> typing.Optional[bytes]:
+        self._update_index()
+        try:
+            offset, length = self._index[key]
+        except KeyError:
+            return None
+        return bytes(self._memory.buf[offset:offset + length])
+
+    def get_many(self, keys: typing.List[str]) -> typing.List[typing.Optional[bytes]]:
+        self._update_index()
+        buf = self._memory.buf
+        values = []
+        for key in keys:
+            try:
+                offset, length = self._index[key]
+                values.append(bytes(buf[offset:offset + length]))
+            except KeyError:
+                values.append(None)
+        return values
+
+    def set(self, key: str, value: bytes) -> None:
+        self._append([(key, value)])
+
+    def set_many(self, values: typing.Dict[str, bytes]) -> None:
+        if values:
+            self._append(list(values.items()))
+
+    def clear(self) -> None:
+        self._write_header(self._generation + 1, self._header.size)
+        self._update_index()
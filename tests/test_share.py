@@ -289,3 +289,90 @@ class TestIndexes(BaseTest):
         foo2.position = (6, 7, 8)
         assert shared.get('{}_position'.format(foo2.id)) == (6, 7, 8)
         assert shared.get('positions') == [(0, 1, 2), (6, 7, 8)]
+
+
+class TestCommit(BaseTest):
+    def test_commit_statistics(self):
+        shared = share.SharedDataManager()
+
+        class Foo(object):
+            counter = shared.create('counter', 0)
+            name = shared.create('name', '')
+
+        foo = Foo()
+        foo.counter = 42
+        foo.name = 'foo'
+
+        statistics = shared.commit()
+        assert statistics is shared.last_commit_statistics
+        assert 2 == statistics.keys_count
+        assert len(pickle.dumps(42)) + len(pickle.dumps('foo')) == statistics.bytes_count
+        assert statistics.duration >= 0
+
+        statistics = shared.commit()
+        assert 0 == statistics.keys_count
+        assert 0 == statistics.bytes_count
+
+    def test_commit_is_batched(self, mocker):
+        shared = share.SharedDataManager()
+        set_many = mocker.spy(shared.backend, 'set_many')
+        set_ = mocker.spy(shared.backend, 'set')
+
+        for i in range(10):
+            shared.set('foo_{}'.format(i), i)
+        shared.commit()
+
+        assert 1 == set_many.call_count
+        assert 0 == set_.call_count
+
+        shared.refresh()
+        assert [shared.get('foo_{}'.format(i)) for i in range(10)] == list(range(10))
+
+
+class TestPrefetch(BaseTest):
+    def test_prefetch(self, mocker):
+        shared = share.SharedDataManager()
+
+        class Foo(IdentifiedObject):
+            counter = shared.create_self('counter', 0)
+            names = shared.create_self('names', lambda: [])
+
+        foos = [Foo() for _ in range(3)]
+        for i, foo in enumerate(foos):
+            foo.counter = i
+        shared.commit()
+        shared.refresh()
+
+        get = mocker.spy(shared.backend, 'get')
+        get_many = mocker.spy(shared.backend, 'get_many')
+
+        keys = shared.get_self_keys([foo.id for foo in foos])
+        assert 6 == len(keys)
+        assert '{}_counter'.format(foos[0].id) in keys
+        assert '{}_names'.format(foos[0].id) in keys
+
+        shared.prefetch(keys)
+        assert 1 == get_many.call_count
+
+        assert [0, 1, 2] == [foo.counter for foo in foos]
+        # names was never set: it's known as missing and default value is used
+        assert [[], [], []] == [foo.names for foo in foos]
+        assert 0 == get.call_count
+
+        # Already loaded keys are not fetched again
+        shared.prefetch(keys)
+        assert [] == get_many.call_args[0][0]
+
+    def test_prefetch_missing_key_forgotten_at_refresh(self):
+        shared = share.SharedDataManager()
+        shared.prefetch(['foo'])
+
+        with pytest.raises(UnknownSharedData):
+            shared.get('foo')
+
+        other_shared = share.SharedDataManager(clear=False)
+        other_shared.set('foo', 42)
+        other_shared.commit()
+
+        shared.refresh()
+        assert 42 == shared.get('foo')
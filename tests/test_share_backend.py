@@ -0,0 +1,98 @@
+# coding: utf-8
+import pytest
+
+from synergine2.config import Config
+from synergine2.processing import ProcessManager
+from synergine2.share import SharedDataManager
+from synergine2.share_backend import MemorySharedDataBackend
+from synergine2.share_backend import RedisSharedDataBackend
+from synergine2.share_backend import SharedDataBackendError
+from synergine2.share_backend import SharedMemorySharedDataBackend
+from tests import BaseTest
+
+
+@pytest.fixture(params=['redis', 'memory', 'shared_memory'])
+def backend(request):
+    if request.param == 'redis':
+        return RedisSharedDataBackend()
+    if request.param == 'memory':
+        return MemorySharedDataBackend()
+    return SharedMemorySharedDataBackend(size=1024 * 1024)
+
+
+class TestBackends(BaseTest):
+    def test_set_get(self, backend):
+        backend.clear()
+        assert backend.get('foo') is None
+
+        backend.set('foo', b'bar')
+        assert backend.get('foo') == b'bar'
+
+        backend.set('foo', b'baz')
+        assert backend.get('foo') == b'baz'
+
+        backend.clear()
+        assert backend.get('foo') is None
+
+    def test_set_many(self, backend):
+        backend.clear()
+        backend.set_many({'foo': b'1', 'bar': b'2'})
+        assert backend.get('foo') == b'1'
+        assert backend.get('bar') == b'2'
+
+    def test_get_many(self, backend):
+        backend.clear()
+        backend.set_many({'foo': b'1', 'bar': b'2'})
+        assert [b'2', None, b'1'] == backend.get_many(['bar', 'baz', 'foo'])
+        assert [] == backend.get_many([])
+
+    def test_shared_data_manager_with_backend(self, backend):
+        shared = SharedDataManager(backend=backend)
+
+        class Foo(object):
+            counter = shared.create('counter', 0)
+
+        foo = Foo()
+        foo.counter = 42
+        shared.commit()
+        shared.refresh()
+
+        assert shared.get('counter') == 42
+
+
+class TestSharedMemoryBackend(BaseTest):
+    def test_compact_when_full(self):
+        backend = SharedMemorySharedDataBackend(size=1024)
+        for i in range(100):
+            backend.set('foo', bytes([i]) * 100)
+        assert backend.get('foo') == bytes([99]) * 100
+
+    def test_full(self):
+        backend = SharedMemorySharedDataBackend(size=1024)
+        with pytest.raises(SharedDataBackendError):
+            backend.set('foo', b'0' * 2048)
+
+    @pytest.mark.timeout(10)
+    def test_visible_by_forked_processes(self):
+        shared = SharedDataManager(backend=SharedMemorySharedDataBackend(size=1024 * 1024))
+
+        def job(worker_id, process_count, key):
+            shared.refresh()
+            return shared.get(key) + 1
+
+        process_manager = ProcessManager(
+            config=Config({}),
+            process_count=2,
+            job=job,
+        )
+        process_manager.start_workers()
+
+        shared.set('foo', 42)
+        shared.commit()
+        assert [43, 43] == process_manager.make_them_work('foo')
+
+        shared.set('bar', 52)
+        shared.commit()
+        assert [53, 53] == process_manager.make_them_work('bar')
+
+        process_manager.terminate()